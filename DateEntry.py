@@ -1,20 +1,90 @@
+import functools
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime
 
 
+# cache results so tabbing back and forth over the same value
+# doesn't re-run the check every focus-out
+@functools.lru_cache(maxsize=128)
+def _is_valid_iso(s):
+    """Check a string is a valid YYYY-MM-DD date without strptime."""
+    # fixed-layout check first, datetime() only for the range check;
+    # explicit isdigit() because int() also accepts signs, whitespace
+    # and underscores
+    if not (len(s) == 10 and s[4] == '-' and s[7] == '-'
+            and s[:4].isdigit() and s[5:7].isdigit()
+            and s[8:10].isdigit()):
+        return False
+    try:
+        datetime(int(s[:4]), int(s[5:7]), int(s[8:10]))
+    except ValueError:
+        return False
+    return True
+
+
+def _is_date_digit(char):
+    """ASCII 0-9 only; ord-range compare skips the Unicode tables."""
+    return len(char) == 1 and 47 < ord(char) < 58
+
+
+def _is_hyphen(char):
+    return char == '-'
+
+
+# keystroke dispatch built once at import: cursor index -> checker, so
+# the per-keypress decision is one dict lookup plus one call
+_KEY_CHECKS = {}
+for _i in ('0', '1', '2', '3', '5', '6', '8', '9'):
+    _KEY_CHECKS[_i] = _is_date_digit
+for _i in ('4', '7'):
+    _KEY_CHECKS[_i] = _is_hyphen
+
+
 class DateEntry(ttk.Entry):
     """An Entry for ISO-style dates (Year-month-day)"""
 
+    # one shared pair of interp-level Tcl commands serves every
+    # instance; they are created with tk.createcommand so their
+    # lifetime isn't tied to whichever widget was built first.
+    # Instances register themselves by pathname and the dispatchers
+    # resolve the widget from the %W substitution.
+    _commands_created = False
+    _instances = dict()
+
+    @classmethod
+    def _dispatch_validate(cls, name, char, index, event, action):
+        widget = cls._instances.get(name)
+        if widget is None:
+            return True
+        return widget._validate(char, index, event, action)
+
+    @classmethod
+    def _dispatch_invalid(cls, name, event):
+        widget = cls._instances.get(name)
+        if widget is not None:
+            widget._on_invalid(event)
+
     def __init__(self, parent, *args, **kwargs):
         super().__init__(parent, *args, **kwargs)
+        if not DateEntry._commands_created:
+            self.tk.createcommand(
+                '_abq_date_validate', DateEntry._dispatch_validate)
+            self.tk.createcommand(
+                '_abq_date_invalid', DateEntry._dispatch_invalid)
+            DateEntry._commands_created = True
+        DateEntry._instances[str(self)] = self
         self.configure(validate='all',
-                       validatecommand=(self.register(self._validate), '%S', '%i', '%V', '%d'),
-                       invalidcommand=(self.register(self._on_invalid), '%V')
+                       validatecommand=('_abq_date_validate', '%W', '%S', '%i', '%V', '%d'),
+                       invalidcommand=('_abq_date_invalid', '%W', '%V')
                        )
-        
+
         self.error = tk.StringVar()
 
+    def destroy(self):
+        DateEntry._instances.pop(str(self), None)
+        super().destroy()
+
     def _toggle_error(self, error=''):
         self.error.set(error)
         self.configure(foreground='red' if error else 'black')
@@ -29,19 +99,12 @@ class DateEntry(ttk.Entry):
         if event == 'key':      # if key is pressed
             if action == '0':   # if deleting(code is 0)
                 valid = True
-            elif index in ('0', '1', '2', '3', '5', '6', '8', '9'):
-                # check int value if entries are string numbers
-                valid = char.isdigit()
-            elif index in ('4', '7'):
-                valid = (char == '-')
             else:
-                valid = False
+                check = _KEY_CHECKS.get(index)
+                valid = check(char) if check else False
         # checking correctness on focus-out
         elif event == 'focusout':
-            try:
-                datetime.strptime(self.get(), '%Y-%m-%d')
-            except ValueError:
-                valid = False
+            valid = _is_valid_iso(self.get())
         
         return valid
 
@@ -49,6 +112,54 @@ class DateEntry(ttk.Entry):
         if event != 'key':
             self._toggle_error('Not a valid date')
 
+    @classmethod
+    def validate_bulk(cls, strings):
+        """Validate many YYYY-MM-DD strings at once, vectorized.
+
+        Returns a NumPy boolean array with one flag per input string.
+        Meant for programmatic fills (e.g. an imported CSV) where
+        looping over _is_valid_iso would dominate; requires NumPy.
+        """
+        # deferred import: only bulk imports need NumPy
+        import numpy as np
+
+        strings = list(strings)
+        result = np.zeros(len(strings), dtype=bool)
+        if not strings:
+            return result
+
+        # only fixed-width candidates can be packed into a 10-column grid
+        lengths = np.fromiter((len(s) for s in strings),
+                              dtype=np.intp, count=len(strings))
+        fixed = np.flatnonzero(lengths == 10)
+        if fixed.size == 0:
+            return result
+
+        joined = ''.join(strings[i] for i in fixed)
+        # non-ASCII chars become '?', which fails the digit checks
+        chars = np.frombuffer(
+            joined.encode('ascii', 'replace'), dtype=np.uint8
+        ).reshape(-1, 10).astype(np.int32)
+
+        digits = (chars >= 48) & (chars <= 57)
+        valid = (digits[:, (0, 1, 2, 3, 5, 6, 8, 9)].all(axis=1)
+                 & (chars[:, 4] == 45) & (chars[:, 7] == 45))
+
+        # decode the digit columns and range-check month and day
+        year = (chars[:, 0] - 48) * 1000 + (chars[:, 1] - 48) * 100 \
+            + (chars[:, 2] - 48) * 10 + (chars[:, 3] - 48)
+        month = (chars[:, 5] - 48) * 10 + (chars[:, 6] - 48)
+        day = (chars[:, 8] - 48) * 10 + (chars[:, 9] - 48)
+
+        valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+        month_days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+        leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+        limit = month_days[np.where(valid, month, 1)] + ((month == 2) & leap)
+        valid &= day <= limit
+
+        result[fixed] = valid
+        return result
+
 
 
 # testing the DateEntry class
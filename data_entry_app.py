@@ -1,293 +1,346 @@
-"""The ABQ Data Entry application"""
-
-import tkinter as tk
-from tkinter import ttk
-from datetime import datetime
-from pathlib import Path
-import csv
-
-
-"""Global variables to keep track of information"""
-# holds all form's control variables
-variables = dict()
-# store number of records saved since opening the app
-records_saved = 0
-
-
-"""Create and configure root window"""
-root = tk.Tk()
-root.title('ABQ Data Entry Application')
-# allow the only column to expand and remain centered when window is expanded
-root.columnconfigure(0, weight=1)
-
-
-# Heading for the application
-ttk.Label(
-    root, text="ABQ Data Entry Application",
-    font=("TkDefault", 16)
-).grid()
-
-
-"""Data Record form - container for the whole form"""
-drf = ttk.Frame(root)
-drf.grid(padx=10, sticky=(tk.E + tk.W))
-drf.columnconfigure(0, weight=1)
-
-# each frame will have 3 columns which all expand evenly to fit frame
-
-"""First section - Record Information"""
-r_info = ttk.LabelFrame(drf, text='Record Information')
-r_info.grid(sticky=(tk.W + tk.E))
-for i in range(3):
-    r_info.columnconfigure(i, weight=1)
-
-# Date 
-variables['Date'] = tk.StringVar()
-ttk.Label(r_info, text='Date').grid(row=0, column=0)
-ttk.Entry(
-    r_info, textvariable=variables['Date']
-).grid(row=1, column=0, sticky=(tk.W + tk.E))
-
-
-# Time
-time_values = ['8:00', '12:00', '16:00', '20:00']
-variables['Time'] = tk.StringVar()
-ttk.Label(r_info, text='Time').grid(row=0, column=1)
-ttk.Combobox(
-    r_info,textvariable=variables['Time'], values=time_values
-).grid(row=1, column=1, sticky=(tk.W + tk.E))
-
-
-# Technician
-variables['Technician'] = tk.StringVar()
-ttk.Label(r_info, text='Technician').grid(row=0, column=2)
-ttk.Entry(
-    r_info, textvariable=variables['Technician']
-).grid(row=1, column=2, sticky=(tk.W + tk.E))
-
-
-# Lab
-variables['Lab'] = tk.StringVar()
-ttk.Label(r_info, text='Lab').grid(row=2, column=0)
-labframe = ttk.Frame(r_info)
-for lab in ('A', 'B', 'C'):
-    ttk.Radiobutton(
-        labframe, value=lab, text=lab, variable=variables['Lab']
-        ).pack(side=tk.LEFT, expand=True)
-labframe.grid(row=3, column=0, sticky=(tk.W + tk.E))
-
-
-# Plot
-variables['Plot'] = tk.IntVar()
-ttk.Label(r_info, text='Plot').grid(row=2, column=1)
-ttk.Combobox(
-    r_info,textvariable=variables['Plot'],
-    values=list(range(1, 21))
-).grid(row=3, column=1, sticky=(tk.W + tk.E))
-
-
-# Seed sample
-variables['Seed Sample'] = tk.StringVar()
-ttk.Label(r_info, text='Seed Sample').grid(row=2, column=2)
-ttk.Entry(
-    r_info, textvariable=variables['Seed Sample']
-).grid(row=3, column=2, sticky=(tk.W + tk.E))
-
-
-"""Second section - Environment Data"""
-e_info = ttk.LabelFrame(drf, text='Environment Data')
-e_info.grid(sticky=(tk.W + tk.E))
-for i in range(3):
-    e_info.columnconfigure(i, weight=1)
-
-# Humidity
-variables['Humidity'] = tk.DoubleVar()
-ttk.Label(e_info, text="Humidity (g/m³)").grid(row=0, column=0)
-ttk.Spinbox(
-    e_info, textvariable=variables['Humidity'],
-    from_=0.5, to=52.0, increment=0.01,
-).grid(row=1, column=0, sticky=(tk.W + tk.E))
-
-
-# Light
-variables['Light'] = tk.DoubleVar()
-ttk.Label(e_info, text="Light (klx)").grid(row=0, column=1)
-ttk.Spinbox(
-    e_info, textvariable=variables['Light'],
-    from_=0, to=100, increment=0.01,
-).grid(row=1, column=1, sticky=(tk.W + tk.E))
-
-
-# Temperature
-variables['Temperature'] = tk.DoubleVar()
-ttk.Label(e_info, text="Temperature (°C)").grid(row=0, column=2)
-ttk.Spinbox(
-    e_info, textvariable=variables['Temperature'],
-    from_=4, to=40, increment=0.01,
-).grid(row=1, column=2, sticky=(tk.W + tk.E))
-
-
-# Equipment Fault
-variables['Equipment Fault'] = tk.BooleanVar(value=False)
-ttk.Checkbutton(
-    e_info, variable=variables['Equipment Fault'],
-    text='Equipment Fault'
-).grid(row=2, column=0, sticky=tk.W, pady=5)
-
-
-"""Third section - Plant Data"""
-p_info = ttk.LabelFrame(drf, text='Plant Data')
-p_info.grid(sticky=(tk.W + tk.E))
-for i in range(3):
-    p_info.columnconfigure(i, weight=1)
-
-# Plants
-variables['Plants'] = tk.IntVar()
-ttk.Label(p_info, text='Plants').grid(row=0, column=0)
-ttk.Spinbox(
-    p_info, textvariable=variables['Plants'],
-    from_=0, to=20, increment=1
-).grid(row=1, column=0, sticky=(tk.W + tk.E))
-
-
-# Blossoms
-variables['Blossoms'] = tk.IntVar()
-ttk.Label(p_info, text='Blossoms').grid(row=0, column=1)
-ttk.Spinbox(
-    p_info, textvariable=variables['Blossoms'],
-    from_=0, to=1000, increment=1
-).grid(row=1, column=1, sticky=(tk.W + tk.E))
-
-
-# Fruit
-variables['Fruit'] = tk.IntVar()
-ttk.Label(p_info, text='Fruit').grid(row=0, column=2)
-ttk.Spinbox(
-    p_info, textvariable=variables['Fruit'],
-    from_=0, to=1000, increment=1
-).grid(row=1, column=2, sticky=(tk.W + tk.E))
-
-
-# Min Height
-variables['Min Height'] = tk.DoubleVar()
-ttk.Label(p_info, text='Min Height (cm)').grid(row=2, column=0)
-ttk.Spinbox(
-    p_info, textvariable=variables['Min Height'],
-    from_=0, to=1000, increment=0.01
-).grid(row=3, column=0, sticky=(tk.W + tk.E))
-
-
-# Max Height
-variables['Max Height'] = tk.DoubleVar()
-ttk.Label(p_info, text='Max Height (cm)').grid(row=2, column=1)
-ttk.Spinbox(
-    p_info, textvariable=variables['Max Height'],
-    from_=0, to=1000, increment=0.01
-).grid(row=3, column=1, sticky=(tk.W + tk.E))
-
-
-# Median Height
-variables['Med Height'] = tk.DoubleVar()
-ttk.Label(p_info, text='Median Height (cm)').grid(row=2, column=2)
-ttk.Spinbox(
-    p_info, textvariable=variables['Med Height'],
-    from_=0, to=1000, increment=0.01
-).grid(row=3, column=2, sticky=(tk.W + tk.E))
-
-
-"""Last section - Notes"""
-ttk.Label(drf, text='Notes').grid()
-notes_inp = tk.Text(drf, width=75, height=10)
-notes_inp.grid(sticky=(tk.W + tk.E))
-
-
-"""Buttons and status"""
-# Button frame
-buttons = tk.Frame(drf)
-buttons.grid(sticky=(tk.E + tk.W))
-
-# Save button
-save_button = ttk.Button(buttons, text='Save')
-save_button.pack(side=tk.RIGHT)
-
-# Reset button
-reset_button = ttk.Button(buttons, text='Reset')
-reset_button.pack(side=tk.RIGHT)
-
-# Status bar
-status_variable = tk.StringVar()
-ttk.Label(
-    root, textvariable=status_variable
-).grid(sticky=(tk.W + tk.E), row=99, padx=10)
-
-
-"""Callback functions and binding"""
-
-# Reset function
-def on_reset():
-    """Called when reset button is clicked, or after record saved."""
-    for variable in variables.values():
-        if isinstance(variable, tk.BooleanVar):
-            variable.set(False)
-        else:
-            variable.set('')
-    
-    notes_inp.delete('1.0', tk.END)
-
-# Bind reset function to reset button
-reset_button.configure(command=on_reset)
-
-
-# Save function
-# Appending entered data to a CSV file
-def on_save():
-    """Handling the save button clicks"""
-
-    # declare records_saved as a global variable
-    global records_saved
-    # get formatted current date
-    datestring = datetime.today().strftime("%Y-%m-%d")
-    # set filename
-    filename = f"abq_data_record_{datestring}.csv"
-    # assigns True if file does not exist, False otherwise
-    newfile = not Path(filename).exists()
-
-    # get data from the form
-    data = dict()
-    fault = variables['Equipment Fault'].get()
-    for key, variable in variables.items():
-        if fault and key in ('Light', 'Humidity', 'Temperature'):
-            data[key] = ''
-        else:
-            try:
-                data[key] = variable.get()
-            except tk.TclError:
-                status_variable.set(f"Error in field: {key}. Data was not saved!")
-                return
-    
-    # get data from the Text widget seperately
-    data['Notes'] = notes_inp.get('1.0', tk.END)
-
-    # Write data to CSV
-    with open(filename, 'a', newline='') as fh:
-        csvwriter = csv.DictWriter(fh, fieldnames=data.keys())
-        if newfile:
-            csvwriter.writeheader()
-        csvwriter.writerow(data)
-
-    # increment records count and alert the user
-    records_saved += 1
-    status_variable.set(f"{records_saved} records saved this session")
-    on_reset()
-
-# Bind save function to save button
-save_button.configure(command=on_save)
-
-
-# Reset the form and launch mainloop
-on_reset()
-root.mainloop()
-
-
-
-
+"""The ABQ Data Entry application"""
+
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+from datetime import date
+from pathlib import Path
+import atexit
+import csv
+import io
+import os
+
+
+"""Global variables to keep track of information"""
+# holds all form's control variables
+variables = dict()
+# store number of records saved since opening the app
+records_saved = 0
+
+# fixed CSV column order, so rows can be written as plain lists
+# instead of DictWriter re-keying a dict on every save
+FIELDNAMES = (
+    'Date', 'Time', 'Technician', 'Lab', 'Plot', 'Seed Sample',
+    'Humidity', 'Light', 'Temperature', 'Equipment Fault',
+    'Plants', 'Blossoms', 'Fruit',
+    'Min Height', 'Max Height', 'Med Height', 'Notes'
+)
+
+# fields stored as integer hundredths so Tk only formats integers on
+# the UI path; scaled back to floats when the record is saved
+SCALED_FIELDS = frozenset({
+    'Humidity', 'Light', 'Temperature',
+    'Min Height', 'Max Height', 'Med Height'
+})
+
+# fields whose raw Tcl value is pre-checked as a number before .get(),
+# keeping TclError handling off the happy save path
+NUMERIC_FIELDS = frozenset({'Plot', 'Plants', 'Blossoms', 'Fruit'}) | SCALED_FIELDS
+
+# field specification driving the form build: one row per input as
+# (name, label, variable class, widget kind, widget options,
+#  (frame, row, column)), iterated by a single builder loop instead of
+# a hand-written block per widget
+FIELDS = (
+    ('Date', 'Date', tk.StringVar, 'entry', None, ('r_info', 0, 0)),
+    ('Time', 'Time', tk.StringVar, 'combobox',
+     {'values': ['8:00', '12:00', '16:00', '20:00']}, ('r_info', 0, 1)),
+    ('Technician', 'Technician', tk.StringVar, 'entry', None, ('r_info', 0, 2)),
+    ('Lab', 'Lab', tk.StringVar, 'radiogroup',
+     {'values': ('A', 'B', 'C')}, ('r_info', 1, 0)),
+    ('Plot', 'Plot', tk.IntVar, 'combobox',
+     {'values': list(range(1, 21))}, ('r_info', 1, 1)),
+    ('Seed Sample', 'Seed Sample', tk.StringVar, 'entry', None, ('r_info', 1, 2)),
+    ('Humidity', 'Humidity (g/m³ × 0.01)', tk.IntVar, 'spinbox',
+     {'from_': 50, 'to': 5200, 'increment': 1}, ('e_info', 0, 0)),
+    ('Light', 'Light (klx × 0.01)', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 10000, 'increment': 1}, ('e_info', 0, 1)),
+    ('Temperature', 'Temperature (°C × 0.01)', tk.IntVar, 'spinbox',
+     {'from_': 400, 'to': 4000, 'increment': 1}, ('e_info', 0, 2)),
+    ('Equipment Fault', 'Equipment Fault', tk.BooleanVar, 'checkbutton',
+     None, ('e_info', 1, 0)),
+    ('Plants', 'Plants', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 20, 'increment': 1}, ('p_info', 0, 0)),
+    ('Blossoms', 'Blossoms', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 1000, 'increment': 1}, ('p_info', 0, 1)),
+    ('Fruit', 'Fruit', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 1000, 'increment': 1}, ('p_info', 0, 2)),
+    ('Min Height', 'Min Height (cm × 0.01)', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 100000, 'increment': 1}, ('p_info', 1, 0)),
+    ('Max Height', 'Max Height (cm × 0.01)', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 100000, 'increment': 1}, ('p_info', 1, 1)),
+    ('Med Height', 'Median Height (cm × 0.01)', tk.IntVar, 'spinbox',
+     {'from_': 0, 'to': 100000, 'increment': 1}, ('p_info', 1, 2)),
+)
+
+# raw descriptor for the session's CSV file, opened lazily on the
+# first save, plus a byte batch buffer: formatted rows accumulate in
+# userspace and reach the kernel in one os.write per flush, bypassing
+# the buffered-IO layer entirely
+_csv_fd = None
+_csv_batch = bytearray()
+_CSV_BATCH_LIMIT = 131072
+
+# reusable in-memory buffer: rows (plus the header, on a new file) are
+# CSV-formatted here before being appended to the byte batch
+_csv_buf = io.StringIO()
+_csv_writer = csv.writer(_csv_buf)
+
+# cache the formatted date, filename and new-file check across saves;
+# they only change when the day rolls over
+_cached_day = None
+_cached_filename = None
+_cached_newfile = None
+
+
+def _flush_csv():
+    """Hand the batched rows to the kernel in a single write."""
+    if _csv_batch:
+        os.write(_csv_fd, _csv_batch)
+        _csv_batch.clear()
+
+
+def _close_csv():
+    """Flush and close the session's CSV file, if one was opened."""
+    global _csv_fd
+    if _csv_fd is not None:
+        _flush_csv()
+        os.close(_csv_fd)
+        _csv_fd = None
+
+# make sure the file is closed however the interpreter exits
+atexit.register(_close_csv)
+
+
+"""Create and configure root window"""
+root = tk.Tk()
+root.title('ABQ Data Entry Application')
+# allow the only column to expand and remain centered when window is expanded
+root.columnconfigure(0, weight=1)
+
+
+# Heading for the application; a named Font object is resolved once
+# and shared, instead of Tk reparsing a tuple spec on every draw
+HEADING_FONT = tkfont.Font(family='TkDefaultFont', size=16)
+ttk.Label(
+    root, text="ABQ Data Entry Application",
+    font=HEADING_FONT
+).grid()
+
+
+"""Data Record form - container for the whole form"""
+drf = ttk.Frame(root)
+drf.grid(padx=10, sticky=(tk.E + tk.W))
+drf.columnconfigure(0, weight=1)
+
+# each frame will have 3 columns which all expand evenly to fit frame
+
+"""Form sections and widgets, built from the FIELDS table"""
+_WIDGET_KINDS = {
+    'entry': ttk.Entry,
+    'combobox': ttk.Combobox,
+    'spinbox': ttk.Spinbox,
+}
+
+
+def _build_field(frame, name, label, var_class, kind, options, row, column):
+    """Create the control variable, label and input widget for one field."""
+    variables[name] = var_class()
+    options = options or {}
+    # checkbuttons carry their own label and sit on the label row
+    if kind == 'checkbutton':
+        ttk.Checkbutton(
+            frame, variable=variables[name], text=label
+        ).grid(row=2 * row, column=column, sticky=tk.W, pady=5)
+        return
+    ttk.Label(frame, text=label).grid(row=2 * row, column=column)
+    if kind == 'radiogroup':
+        widget = ttk.Frame(frame)
+        for value in options['values']:
+            ttk.Radiobutton(
+                widget, value=value, text=value, variable=variables[name]
+            ).pack(side=tk.LEFT, expand=True)
+    else:
+        widget = _WIDGET_KINDS[kind](
+            frame, textvariable=variables[name], **options)
+    widget.grid(row=2 * row + 1, column=column, sticky=(tk.W + tk.E))
+
+
+# the three labelled sections
+frames = dict()
+for key, text in (
+        ('r_info', 'Record Information'),
+        ('e_info', 'Environment Data'),
+        ('p_info', 'Plant Data')):
+    frame = ttk.LabelFrame(drf, text=text)
+    frame.grid(sticky=(tk.W + tk.E))
+    for i in range(3):
+        frame.columnconfigure(i, weight=1)
+    frames[key] = frame
+
+# build every field from the spec table
+for name, label, var_class, kind, options, (frame_key, row, column) in FIELDS:
+    _build_field(frames[frame_key], name, label, var_class, kind, options, row, column)
+
+# track which fields have been written since the last reset, so reset
+# only pays a Tcl variable write for fields the user actually touched;
+# seeded with every key so the startup reset still blanks the whole
+# form (IntVars would otherwise keep showing their Tcl default 0)
+_dirty = set(variables)
+for _name, _variable in variables.items():
+    _variable.trace_add('write', lambda *_, k=_name: _dirty.add(k))
+
+# partition the variables once at build time; which fields are
+# BooleanVars is static, so reset needs no per-field isinstance check
+_bool_vars = {k: v for k, v in variables.items() if isinstance(v, tk.BooleanVar)}
+_other_vars = {k: v for k, v in variables.items() if not isinstance(v, tk.BooleanVar)}
+
+
+"""Last section - Notes"""
+ttk.Label(drf, text='Notes').grid()
+notes_inp = tk.Text(drf, width=75, height=10)
+notes_inp.grid(sticky=(tk.W + tk.E))
+
+
+"""Buttons and status"""
+# Button frame
+buttons = tk.Frame(drf)
+buttons.grid(sticky=(tk.E + tk.W))
+
+# Save button
+save_button = ttk.Button(buttons, text='Save')
+save_button.pack(side=tk.RIGHT)
+
+# Reset button
+reset_button = ttk.Button(buttons, text='Reset')
+reset_button.pack(side=tk.RIGHT)
+
+# Status bar
+status_variable = tk.StringVar()
+ttk.Label(
+    root, textvariable=status_variable
+).grid(sticky=(tk.W + tk.E), row=99, padx=10)
+
+
+"""Callback functions and binding"""
+
+# Reset function
+def on_reset():
+    """Called when reset button is clicked, or after record saved."""
+    # only touched fields need resetting; untouched ones are clean
+    for key in tuple(_dirty):
+        if key in _bool_vars:
+            _bool_vars[key].set(False)
+        else:
+            _other_vars[key].set('')
+    # the resets above re-marked their fields dirty via the traces
+    _dirty.clear()
+
+    notes_inp.delete('1.0', tk.END)
+
+# Bind reset function to reset button
+reset_button.configure(command=on_reset)
+
+
+# Save function
+# Appending entered data to a CSV file
+def on_save():
+    """Handling the save button clicks"""
+
+    # declare module-level state rebound in this function
+    global records_saved, _csv_fd
+    global _cached_day, _cached_filename, _cached_newfile
+
+    # bind hot globals to locals (LOAD_FAST instead of LOAD_GLOBAL)
+    _vars = variables
+    _status = status_variable
+    _notes = notes_inp
+
+    # recompute the filename and new-file check only when the day changes
+    today = date.today()
+    if today.toordinal() != _cached_day:
+        _cached_day = today.toordinal()
+        _cached_filename = f"abq_data_record_{today.isoformat()}.csv"
+        _cached_newfile = not Path(_cached_filename).exists()
+        # a new day means a new file: drop the old session handle
+        _close_csv()
+    filename = _cached_filename
+    newfile = _cached_newfile
+
+    # get data from the form
+    data = dict()
+    fault = _vars['Equipment Fault'].get()
+    for key, variable in _vars.items():
+        if fault and key in ('Light', 'Humidity', 'Temperature'):
+            data[key] = ''
+        elif key in NUMERIC_FIELDS:
+            # validate the raw Tcl string cheaply first, so .get()
+            # rarely raises on the happy path
+            raw = str(variable._tk.globalgetvar(variable._name))
+            try:
+                float(raw)
+            except ValueError:
+                _status.set(f"Error in field: {key}. Data was not saved!")
+                return
+            try:
+                # backstop: Tcl's number grammar is stricter than
+                # float() (it rejects e.g. 'nan' and '1_0')
+                value = variable.get()
+            except tk.TclError:
+                _status.set(f"Error in field: {key}. Data was not saved!")
+                return
+            # hundredths-scaled fields are emitted as floats
+            data[key] = value / 100 if key in SCALED_FIELDS else value
+        else:
+            # string and boolean variables can't fail conversion
+            data[key] = variable.get()
+
+    # get data from the Text widget seperately; skip the Tcl dump when
+    # it is empty, and stop before the widget's trailing newline
+    if _notes.index('end-1c') == '1.0':
+        data['Notes'] = ''
+    else:
+        data['Notes'] = _notes.get('1.0', 'end-1c')
+
+    # Write data to CSV, keeping the descriptor open for the whole
+    # session. Rows are CSV-formatted into the shared buffer, batched
+    # as bytes, and flushed with one os.write when the batch fills;
+    # closing the file on exit or day rollover flushes the remainder.
+    if _csv_fd is None:
+        _csv_fd = os.open(filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if newfile:
+            _csv_writer.writerow(FIELDNAMES)
+            _cached_newfile = False
+    _csv_writer.writerow([data[key] for key in FIELDNAMES])
+    _csv_batch.extend(_csv_buf.getvalue().encode())
+    # rewind the buffer for the next save
+    _csv_buf.seek(0)
+    _csv_buf.truncate()
+    if len(_csv_batch) > _CSV_BATCH_LIMIT:
+        _flush_csv()
+
+    # increment records count and alert the user
+    records_saved += 1
+    _status.set(f"{records_saved} records saved this session")
+    on_reset()
+
+# Bind save function to save button
+save_button.configure(command=on_save)
+
+
+# Close the CSV file when the window is closed
+def on_close():
+    """Close the session's CSV file before destroying the window."""
+    _close_csv()
+    root.destroy()
+
+root.protocol('WM_DELETE_WINDOW', on_close)
+
+
+# Reset the form and launch mainloop
+on_reset()
+root.mainloop()
+
+
+
+
@@ -1,6 +1,7 @@
 """Class version of the ABQ Data Entry application"""
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import csv
 import tkinter as tk
@@ -14,6 +15,8 @@ class BoundText(tk.Text):
     def __init__(self, *args, textvariable=None, **kwargs):
         super().__init__(*args, **kwargs)
         self._variable = textvariable
+        # handle of a pending debounced variable sync, if any
+        self._sync_pending = None
 
         # if user provided a variable
         if self._variable:
@@ -23,14 +26,31 @@ class BoundText(tk.Text):
             # bind a method to update variable when Text widget is modified
             # event only fires once
             self.bind('<<Modified>>', self._set_var)
+            # a pending sync must land before focus moves elsewhere
+            self.bind('<FocusOut>', self._flush_var)
 
     def _set_content(self, *_):
         """Set the text contents to the variable"""
-        self.delete('1.0', tk.END)
-        self.insert('1.0', self._variable.get())
+        # one Tcl replace instead of delete+insert, and the Modified
+        # flag is cleared so the write doesn't bounce into _set_var
+        self.replace('1.0', 'end-1c', self._variable.get())
+        self.edit_modified(False)
 
     def _set_var(self, *_):
-        """Set the variable to the text content."""
+        """Schedule a variable sync, coalescing keystroke bursts.
+
+        Dumping the widget and writing the StringVar on every keystroke
+        costs a full text copy per character; waiting 75 ms collapses a
+        typing burst into a single sync.
+        """
+        if self.edit_modified() and self._sync_pending is None:
+            self._sync_pending = self.after(75, self._flush_var)
+
+    def _flush_var(self, *_):
+        """Sync the variable with the text content immediately."""
+        if self._sync_pending is not None:
+            self.after_cancel(self._sync_pending)
+            self._sync_pending = None
         if self.edit_modified():
             content = self.get('1.0', 'end-1chars')
             self._variable.set(content)
@@ -94,143 +114,53 @@ class LabelInput(tk.Frame):
 class DataRecordForm(ttk.Frame):
     """Input form for the widgets."""
 
-    def _add_frame(self, label, cols=3):
+    def _add_frame(self, label, cols=3, row=None):
         """Add a LabelFrame to the form."""
         frame = ttk.LabelFrame(self, text=label)
-        frame.grid(sticky=tk.W + tk.E)
+        if row is None:
+            frame.grid(sticky=tk.W + tk.E)
+        else:
+            frame.grid(sticky=tk.W + tk.E, row=row)
         for i in range(cols):
             frame.columnconfigure(i, weight=1)
 
         return frame
 
+    def _build_section(self, title, fields, row):
+        """Build one LabelFrame section and its fields from FORM_SPEC."""
+        frame = self._add_frame(title, row=row)
+        for key, label, _var_class, input_class, input_args, grid_args in fields:
+            LabelInput(frame, label, var=self._vars[key],
+                       input_class=input_class,
+                       input_args=input_args).grid(**grid_args)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # dictionary to hold all the variable objects
-        self._vars = {
-            'Date': tk.StringVar(),
-            'Time': tk.StringVar(),
-            'Technician': tk.StringVar(),
-            'Lab': tk.StringVar(),
-            'Plot': tk.IntVar(),
-            'Seed Sample': tk.StringVar(),
-            'Humidity': tk.DoubleVar(),
-            'Light': tk.DoubleVar(),
-            'Temperature': tk.DoubleVar(),
-            'Equipment Fault': tk.BooleanVar(),
-            'Plants': tk.IntVar(),
-            'Blossoms': tk.IntVar(),
-            'Fruit': tk.IntVar(),
-            'Min Height': tk.DoubleVar(),
-            'Max Height': tk.DoubleVar(),
-            'Med Height': tk.DoubleVar(),
-            'Notes': tk.StringVar()
-        }
-
-        # building the Record Information section
-        # creating the record information frame
-        r_info = self._add_frame('Record Information')
-
-        LabelInput(r_info, 'Date', var=self._vars['Date'], input_class=DateEntry
-            ).grid(row=0, column=0)
-
-        LabelInput(r_info,
-                   'Time',
-                   input_class=ValidatedCombobox,
-                   var=self._vars['Time'],
-                   input_args={'values': ["8:00", "12:00", "16:00", "20:00"]}
-                   ).grid(row=0, column=1)
-        
-        LabelInput(r_info,
-                   'Technician',
-                   var=self._vars['Technician'],
-                   input_class=RequiredEntry
-                   ).grid(row=0, column=2)
-        
-        LabelInput(r_info,
-                   'Lab',
-                   input_class=ValidatedRadioGroup,
-                   var=self._vars['Lab'],
-                   input_args={'values': ["A", "B", "C"]}
-                   ).grid(row=1, column=0)
-        
-        LabelInput(r_info,
-                   'Plot',
-                   input_class=ValidatedCombobox,
-                   var=self._vars['Plot'],
-                   input_args={'values': list(range(1, 21))}
-                   ).grid(row=1, column=1)
-        
-        LabelInput(r_info,
-                   'Seed Sample',
-                   var=self._vars['Seed Sample'],
-                   input_class=RequiredEntry).grid(row=1, column=2)
-        
-        # building the Environmental Data section
-        e_info = self._add_frame('Environmental Data')
-
-        LabelInput(e_info, "Humidity (g/m³)",
-                   input_class=ValidatedSpinbox, 
-                   var=self._vars['Humidity'],
-                   input_args={"from_": 0.5, "to": 52.0, "increment": .01}
-                   ).grid(row=0, column=0)
-        
-        LabelInput(e_info, "Light (klx)",
-                   input_class=ValidatedSpinbox,
-                   var=self._vars['Light'],
-                   input_args={"from_": 0, "to": 100, "increment": .01}
-                   ).grid(row=0, column=1)
-        
-        LabelInput(e_info, "Temperature (°C)",
-                   input_class=ValidatedSpinbox,
-                   var=self._vars['Temperature'],
-                   input_args={"from_": 4, "to": 40, "increment": .01}
-                   ).grid(row=0, column=2)
-        
-        LabelInput(e_info, "Equipment Fault",
-                   input_class=ttk.Checkbutton, 
-                   var=self._vars['Equipment Fault']
-                   ).grid(row=1, column=0, columnspan=3)
-        
-        # building the Plant Data section
-        p_info = self._add_frame('Plant Data')
-
-        LabelInput(p_info, "Plants", 
-                   input_class=ValidatedSpinbox,
-                   var=self._vars['Plants'],
-                   input_args={"from_": 0, "to": 20}
-                   ).grid(row=0, column=0)
-        
-        LabelInput(p_info, "Blossoms",
-                   input_class=ValidatedSpinbox,
-                   var=self._vars['Blossoms'],
-                   input_args={"from_": 0, "to": 1000}
-                   ).grid(row=0, column=1)
-        
-        LabelInput(p_info, "Fruit", 
-                   input_class=ValidatedSpinbox,
-                   var=self._vars['Fruit'],
-                   input_args={"from_": 0, "to": 1000}
-                   ).grid(row=0, column=2)
-        
-        LabelInput(p_info, "Min Height (cm)",
-                   input_class=ttk.Spinbox,
-                   var=self._vars['Min Height'],
-                   input_args={"from_": 0, "to": 1000, "increment": .01}
-                   ).grid(row=1, column=0)
-        
-        LabelInput(p_info, "Max Height (cm)",
-                   input_class=ttk.Spinbox,
-                   var=self._vars['Max Height'],
-                   input_args={"from_": 0, "to": 1000, "increment": .01}
-                   ).grid(row=1, column=1)
-        
-        LabelInput(p_info, "Median Height (cm)",
-                   input_class=ttk.Spinbox,
-                   var=self._vars['Med Height'],
-                   input_args={"from_": 0, "to": 1000, "increment": .01}
-                   ).grid(row=1, column=2)
-        
+        # create every control variable up front (cheap), so get() and
+        # reset() work even before all sections are on screen
+        self._vars = dict()
+        for _section, fields in FORM_SPEC:
+            for key, _label, var_class, *_rest in fields:
+                self._vars[key] = var_class()
+        self._vars['Notes'] = tk.StringVar()
+
+        # only the first (visible) section is built synchronously; the
+        # rest are constructed on idle ticks once the main loop is
+        # reachable, cutting first-paint latency
+        first, *rest = FORM_SPEC
+        self._build_section(*first, row=0)
+        for row, section in enumerate(rest, start=1):
+            self.after_idle(
+                lambda s=section, r=row: self._build_section(*s, row=r))
+
+        # partition the variables once; which ones are BooleanVars is
+        # static, so reset skips the per-variable isinstance check
+        self._bool_vars = [
+            v for v in self._vars.values() if isinstance(v, tk.BooleanVar)]
+        self._other_vars = [
+            v for v in self._vars.values() if not isinstance(v, tk.BooleanVar)]
+
         # widgets in the main window
         LabelInput(self, "Notes",
                    input_class=BoundText,
@@ -248,88 +178,177 @@ class DataRecordForm(ttk.Frame):
         self.resetbutton = ttk.Button(buttons, text="Reset", command=self.reset)
         self.resetbutton.pack(side=tk.RIGHT)
 
+        # fixed field order for writing CSV rows
+        self.fieldnames = tuple(self._vars.keys())
+
+        # flat save plan of (key, bound getter, is-environment-field),
+        # so get() runs without per-field membership tests or
+        # attribute lookups
+        self._get_plan = tuple(
+            (k, v.get, k in {'Light', 'Humidity', 'Temperature'})
+            for k, v in self._vars.items())
+
     def reset(self):
         """Reset the form entries"""
-        for var in self._vars.values():
-            if isinstance(var, tk.BooleanVar):
-                var.set(False)
-            else:
-                var.set('')
+        for var in self._bool_vars:
+            var.set(False)
+        for var in self._other_vars:
+            var.set('')
 
     def get(self):
         """Retrieve data from the form"""
+        # make sure any debounced Notes edit has been synced
+        self._vars['Notes'].label_widget.input._flush_var()
         data = dict()
         fault = self._vars['Equipment Fault'].get()
-        for key, variable in self._vars.items():
-            if fault and key in ('Light', 'Humidity', 'Temperature'):
-                data[key] = ''
-            else:
-                try:
-                    data[key] = variable.get()
-                except tk.TclError:
-                    message = f"Error in field: {key}. Data is not saved!"
-                    raise ValueError(message)
+        # one exception block around the whole loop instead of one per
+        # field; the offending key is tracked in a local
+        cur = None
+        try:
+            for key, getter, is_env in self._get_plan:
+                cur = key
+                data[key] = '' if (fault and is_env) else getter()
+        except tk.TclError:
+            message = f"Error in field: {cur}. Data is not saved!"
+            raise ValueError(message)
         return data
 
 
+# maps Tk percent substitutions to the validator kwargs they become
+_SUB_NAMES = {
+    '%P': 'proposed', '%s': 'current', '%S': 'char',
+    '%V': 'event', '%i': 'index', '%d': 'action',
+}
+
+
+class _NullVar:
+    """A do-nothing stand-in for an unused error variable.
+
+    Nothing on the form traces the per-widget error variables, so a
+    real tk.StringVar would register a Tcl variable per widget and pay
+    a Tcl write on every validation miss for nothing. Callers that
+    want a visible error label can still pass a real StringVar.
+    """
+
+    def set(self, value):
+        pass
+
+    def get(self):
+        return ''
+
+
 # mixin class to help create validated widget classes
 class ValidatedMixin:
     """Adds a validation functionality to an input widget"""
 
+    # percent substitutions this widget's validators actually read;
+    # subclasses narrow the tuple so Tk skips the unused Tcl->Python
+    # string coercions on every keystroke ('%V' must stay included)
+    _subs = ('%P', '%s', '%S', '%V', '%i', '%d')
+
+    # one shared pair of Tcl commands serves every validated widget:
+    # instances register themselves by pathname and the trampolines
+    # dispatch on the %W substitution, instead of two fresh Tcl
+    # commands per instance
+    _instances = dict()
+    _commands_created = False
+
+    @staticmethod
+    def _dispatch_validate(name, *args):
+        widget = ValidatedMixin._instances.get(name)
+        return widget._validate(*args) if widget is not None else True
+
+    @staticmethod
+    def _dispatch_invalid(name, *args):
+        widget = ValidatedMixin._instances.get(name)
+        if widget is not None:
+            widget._invalid(*args)
+
     def __init__(self, *args, error_var=None, **kwargs):
-        self.error = error_var or tk.StringVar()
+        self.error = error_var if error_var is not None else _NullVar()
+        # mirror the widget's disabled state in Python so _validate
+        # doesn't query it from Tcl on every keystroke
+        self._disabled = kwargs.get('state') == tk.DISABLED
+        # current error-color state, so _toggle_error only configures
+        # the widget on actual transitions
+        self._err_on = False
         super().__init__(*args, **kwargs)
 
-        vcmd = self.register(self._validate)
-        invcmd = self.register(self._invalid)
+        if not ValidatedMixin._commands_created:
+            self.tk.createcommand(
+                '_abq_validate', ValidatedMixin._dispatch_validate)
+            self.tk.createcommand(
+                '_abq_invalid', ValidatedMixin._dispatch_invalid)
+            ValidatedMixin._commands_created = True
+        ValidatedMixin._instances[str(self)] = self
 
         self.configure(
             validate='all',
-            validatecommand=(vcmd, '%P', '%s', '%S', '%V', '%i', '%d'),
-            invalidcommand=(invcmd, '%P', '%s', '%S', '%V', '%i', '%d')
+            validatecommand=('_abq_validate', '%W') + self._subs,
+            invalidcommand=('_abq_invalid', '%W') + self._subs
         )
 
+    def destroy(self):
+        ValidatedMixin._instances.pop(str(self), None)
+        super().destroy()
+
+    def configure(self, cnf=None, **kwargs):
+        # keep the local disabled flag in step with the widget state
+        state = kwargs.get('state')
+        if state is None and isinstance(cnf, dict):
+            state = cnf.get('state')
+        if state is not None:
+            self._disabled = (state == tk.DISABLED)
+        return super().configure(cnf, **kwargs)
+
+    def state(self, statespec=None):
+        if statespec:
+            if 'disabled' in statespec:
+                self._disabled = True
+            elif '!disabled' in statespec:
+                self._disabled = False
+        return super().state(statespec)
+
     def _toggle_error(self, on=False):
+        # most keystrokes are valid, so the common case is a single
+        # comparison instead of a Tcl configure and a redraw
+        if on == self._err_on:
+            return
+        self._err_on = on
         self.configure(foreground=('red' if on else 'black'))
 
-    def _validate(self, proposed, current, char, event, index, action):
+    def _validate(self, *args):
+        # rebuild kwargs from whichever substitutions this class uses
+        kwargs = dict(zip((_SUB_NAMES[s] for s in self._subs), args))
         self.error.set('')
         self._toggle_error()
         valid = True
         # don't validate if widget is disabled
-        state = str(self.configure('state')[-1])
-        if state == tk.DISABLED:
+        if self._disabled:
             return valid
-        
+
+        event = kwargs['event']
         if event == 'focusout':
             valid = self._focusout_validate(event=event)
         elif event == 'key':
-            valid = self._key_validate(proposed=proposed,
-                                       current=current,
-                                       char=char,
-                                       event=event,
-                                       index=index,
-                                       action=action)
+            valid = self._key_validate(**kwargs)
         return valid
-        
+
     # placeholders for the event-specific validation methods
     def _focusout_validate(self, **kwargs):
         return True
-    
+
     def _key_validate(self, **kwargs):
         return True
 
-    def _invalid(self, proposed, current, char, event, index, action):
+    def _invalid(self, *args):
+        kwargs = dict(zip((_SUB_NAMES[s] for s in self._subs), args))
+        event = kwargs['event']
         if event == 'focusout':
             self._focusout_invalid(event=event)
         elif event =='key':
-            self._key_invalid(proposed=proposed,
-                              current=current,
-                              char=char,
-                              event=event,
-                              index=index,
-                              action=action)
-            
+            self._key_invalid(**kwargs)
+
     def _focusout_invalid(self, **kwargs):
         """Handles invalid data on focus-out event"""
         self._toggle_error(True)
@@ -340,7 +359,8 @@ class ValidatedMixin:
 
     # manually execute focus-out validation on the widgets
     def trigger_focusout_validation(self):
-        valid = self._validate('', '', '', 'focusout', '', '')
+        args = tuple('focusout' if s == '%V' else '' for s in self._subs)
+        valid = self._validate(*args)
         if not valid:
             self._focusout_invalid(event='focusout')
         return valid
@@ -349,6 +369,9 @@ class ValidatedMixin:
 class RequiredEntry(ValidatedMixin, ttk.Entry):
     """An Entry that requires a value"""
 
+    # only validates on focus-out, so only the event name is needed
+    _subs = ('%V',)
+
     def _focusout_validate(self, event):
         valid = True
         if not self.get():
@@ -360,17 +383,23 @@ class RequiredEntry(ValidatedMixin, ttk.Entry):
 class DateEntry(ValidatedMixin, ttk.Entry):
     """An Entry that only accepts ISO Date strings"""
 
+    _subs = ('%S', '%i', '%V', '%d')
+
+    # per-position character checkers for YYYY-MM-DD, built once at
+    # class definition so each keystroke is one lookup plus one call
+    _DATE_SLOT = (
+        str.isdigit, str.isdigit, str.isdigit, str.isdigit,
+        lambda c: c == '-',
+        str.isdigit, str.isdigit,
+        lambda c: c == '-',
+        str.isdigit, str.isdigit,
+    )
+
     def _key_validate(self, action, index, char, **kwargs):
-        valid = True
         if action == '0':
-            valid = True
-        elif index in ('0', '1', '2', '3', '5', '6', '8', '9'):
-            valid = char.isdigit()
-        elif index in ('4', '7'):
-            valid = (char == '-')
-        else:
-            valid = False
-        return valid
+            return True
+        i = int(index)
+        return i < 10 and DateEntry._DATE_SLOT[i](char)
 
     def _focusout_validate(self, event):
         valid = True
@@ -388,21 +417,70 @@ class DateEntry(ValidatedMixin, ttk.Entry):
 class ValidatedCombobox(ValidatedMixin, ttk.Combobox):
     """A combobox that only takes values from its string list"""
 
+    _subs = ('%P', '%V', '%d')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache_values()
+
+    def _cache_values(self):
+        """Build a prefix trie over the lowercased values list."""
+        # dict-of-dicts keyed by character, with '$' holding the
+        # original-case string at terminal nodes; prefix lookups are
+        # O(len(prefix)) no matter how long the values list grows
+        self._trie = dict()
+        for value in self.cget('values'):
+            value = str(value)
+            node = self._trie
+            for char in value.lower():
+                node = node.setdefault(char, {})
+            node['$'] = value
+
+    def configure(self, cnf=None, **kwargs):
+        result = super().configure(cnf, **kwargs)
+        # keep the prefix trie in step with the widget's values list
+        if 'values' in kwargs or (cnf and 'values' in cnf):
+            self._cache_values()
+        return result
+
+    def _find_prefix(self, prefix):
+        """Walk the trie to the node for prefix, or None if no match."""
+        node = self._trie
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def any_match(self, prefix):
+        """Check whether any value starts with the given prefix."""
+        return self._find_prefix(prefix.lower()) is not None
+
+    def unique_match(self, prefix):
+        """Return the only value starting with prefix, or None."""
+        node = self._find_prefix(prefix.lower())
+        # follow the chain while exactly one continuation exists; a
+        # node with siblings (or '$' plus children) means several
+        # values share the prefix
+        while node is not None and len(node) == 1:
+            if '$' in node:
+                return node['$']
+            node = next(iter(node.values()))
+        return None
+
     def _key_validate(self, proposed, action, **kwargs):
-        valid = True
         if action == '0':
             self.set('')
             return True
-        # get values list
-        values = self.cget('values')
-        matching = [x for x in values if x.lower().startswith(proposed.lower())]
-        if len(matching) == 0:
-            valid = False
-        elif len(matching) == 1:
-            self.set(matching[0])
+        if not self.any_match(proposed):
+            return False
+        match = self.unique_match(proposed)
+        if match is not None:
+            # unique match: autocomplete with the original casing
+            self.set(match)
             self.icursor(tk.END)
-            valid = False   # stops any further input to the widget, even appending the proposed keystroke
-        return valid
+            return False   # stops any further input to the widget, even appending the proposed keystroke
+        return True
 
     def _focusout_validate(self, event):
         valid = True
@@ -412,45 +490,55 @@ class ValidatedCombobox(ValidatedMixin, ttk.Combobox):
         return valid
 
 
+# most spinboxes on the form share the same increment, so the Decimal
+# construction and normalize() run once per distinct increment string
+@lru_cache(maxsize=32)
+def _precision_for(inc_str):
+    """Exponent of an increment string, e.g. '0.01' -> -2."""
+    return Decimal(inc_str).normalize().as_tuple().exponent
+
+
 class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
     def __init__(self, *args, from_='-Infinity', to='Infinity', **kwargs):
         super().__init__(*args, from_=from_, to=to, **kwargs)
-        increment = Decimal(str(kwargs.get('increment', '1.0')))
-        self.precision = increment.normalize().as_tuple().exponent
+        self.precision = _precision_for(str(kwargs.get('increment', '1.0')))
+        # cache the range as Decimals: cget('from')/cget('to') would
+        # round-trip to Tcl and reparse strings on every keystroke
+        self._min = Decimal(str(from_))
+        self._max = Decimal(str(to))
+        self._no_negative = self._min >= 0
+        self._no_decimal = self.precision >= 0
 
     def _key_validate(self, char, index, current, proposed, action, **kwargs):
         if action == '0':
             return True
         valid = True
-        min_val = self.cget('from')
-        max_val = self.cget('to')
-        # flag variables
-        no_negative = min_val >= 0
-        no_decimal = self.precision >= 0
 
         # test if proposed keystroke is a valid character
         if any([
             (char not in '-1234567890.'),
-            (char == '-' and (no_negative or index != '0')),
-            (char == '.' and (no_decimal or '.' in current))]):
+            (char == '-' and (self._no_negative or index != '0')),
+            (char == '.' and (self._no_decimal or '.' in current))]):
             return False
         
         # check for combination of '-.'
         if proposed in '-.':
             return True
 
+        # reject over-precision from the string itself, before paying
+        # for a Decimal construction and as_tuple() call
+        dot = proposed.find('.')
+        if dot >= 0 and len(proposed) - dot - 1 > -self.precision:
+            return False
+
         # at this stage proposed text meets the specifications of a Decimal
-        proposed = Decimal(proposed)
-        proposed_precision = proposed.as_tuple().exponent
-        if any([(proposed > max_val), (proposed_precision < self.precision)]):
+        if Decimal(proposed) > self._max:
             return False
         return valid
 
     def _focusout_validate(self, **kwargs):
         valid = True
         value = self.get()
-        min_val = self.cget('from')
-        max_val = self.cget('to')
 
         try:
             d_value = Decimal(value)
@@ -458,11 +546,11 @@ class ValidatedSpinbox(ValidatedMixin, ttk.Spinbox):
             self.error.set(f'Invalid number string: {value}')
             return False
 
-        if d_value < min_val:
-            self.error.set(f'Value is too low (min {min_val})')
+        if d_value < self._min:
+            self.error.set(f'Value is too low (min {self._min})')
             valid = False
-        if d_value > max_val:
-            self.error.set(f'Value is too high (max {max_val})')
+        if d_value > self._max:
+            self.error.set(f'Value is too high (max {self._max})')
             valid = False
         return valid
 
@@ -491,6 +579,57 @@ class ValidatedRadioGroup(ttk.Frame):
 
 ##############################################################
 
+# shared option singletons, so repeated widget configurations aren't
+# reallocated for every construction
+_TIME_VALUES = ("8:00", "12:00", "16:00", "20:00")
+_LAB_VALUES = ("A", "B", "C")
+_PLOT_VALUES = tuple(range(1, 21))
+
+# declarative form layout consumed by DataRecordForm: each section is
+# (title, fields) and each field is (key, label, variable class,
+# input class, input args, grid args)
+FORM_SPEC = (
+    ('Record Information', (
+        ('Date', 'Date', tk.StringVar, DateEntry,
+         None, {'row': 0, 'column': 0}),
+        ('Time', 'Time', tk.StringVar, ValidatedCombobox,
+         {'values': _TIME_VALUES}, {'row': 0, 'column': 1}),
+        ('Technician', 'Technician', tk.StringVar, RequiredEntry,
+         None, {'row': 0, 'column': 2}),
+        ('Lab', 'Lab', tk.StringVar, ValidatedRadioGroup,
+         {'values': _LAB_VALUES}, {'row': 1, 'column': 0}),
+        ('Plot', 'Plot', tk.IntVar, ValidatedCombobox,
+         {'values': _PLOT_VALUES}, {'row': 1, 'column': 1}),
+        ('Seed Sample', 'Seed Sample', tk.StringVar, RequiredEntry,
+         None, {'row': 1, 'column': 2}),
+    )),
+    ('Environmental Data', (
+        ('Humidity', 'Humidity (g/m³)', tk.DoubleVar, ValidatedSpinbox,
+         {'from_': 0.5, 'to': 52.0, 'increment': .01}, {'row': 0, 'column': 0}),
+        ('Light', 'Light (klx)', tk.DoubleVar, ValidatedSpinbox,
+         {'from_': 0, 'to': 100, 'increment': .01}, {'row': 0, 'column': 1}),
+        ('Temperature', 'Temperature (°C)', tk.DoubleVar, ValidatedSpinbox,
+         {'from_': 4, 'to': 40, 'increment': .01}, {'row': 0, 'column': 2}),
+        ('Equipment Fault', 'Equipment Fault', tk.BooleanVar, ttk.Checkbutton,
+         None, {'row': 1, 'column': 0, 'columnspan': 3}),
+    )),
+    ('Plant Data', (
+        ('Plants', 'Plants', tk.IntVar, ValidatedSpinbox,
+         {'from_': 0, 'to': 20}, {'row': 0, 'column': 0}),
+        ('Blossoms', 'Blossoms', tk.IntVar, ValidatedSpinbox,
+         {'from_': 0, 'to': 1000}, {'row': 0, 'column': 1}),
+        ('Fruit', 'Fruit', tk.IntVar, ValidatedSpinbox,
+         {'from_': 0, 'to': 1000}, {'row': 0, 'column': 2}),
+        ('Min Height', 'Min Height (cm)', tk.DoubleVar, ttk.Spinbox,
+         {'from_': 0, 'to': 1000, 'increment': .01}, {'row': 1, 'column': 0}),
+        ('Max Height', 'Max Height (cm)', tk.DoubleVar, ttk.Spinbox,
+         {'from_': 0, 'to': 1000, 'increment': .01}, {'row': 1, 'column': 1}),
+        ('Med Height', 'Median Height (cm)', tk.DoubleVar, ttk.Spinbox,
+         {'from_': 0, 'to': 1000, 'increment': .01}, {'row': 1, 'column': 2}),
+    )),
+)
+
+
 class Application(tk.Tk):
     """Application root window"""
 
@@ -514,25 +653,54 @@ class Application(tk.Tk):
         # hold number of records saved
         self._records_saved = 0
 
+        # the day's CSV file: computed, stat'ed and opened once per
+        # day, with a plain csv.writer over the fixed field order
+        # instead of a fresh DictWriter per save
+        self._fieldnames = self.recordform.fieldnames
+        self._open_csv()
+
+        # close the file cleanly when the window is closed
+        self.protocol('WM_DELETE_WINDOW', self._on_close)
+
+    def _open_csv(self):
+        """Open the current day's CSV file and note the day."""
+        today = datetime.today()
+        self._cached_day = today.toordinal()
+        self._filename = f"abq_data_record_{today.strftime('%Y-%m-%d')}.csv"
+        # one stat at open decides whether a header is still owed;
+        # after that the flag alone is consulted, never the filesystem.
+        # Size matters, not existence: opening in append mode creates
+        # the file, so a zero-save session leaves an empty CSV that
+        # still needs its header next time.
+        path = Path(self._filename)
+        self._header_written = path.exists() and path.stat().st_size > 0
+        self._fh = open(self._filename, 'a', newline='')
+        self._csv = csv.writer(self._fh)
+
+    def _on_close(self):
+        """Close the session's CSV file before destroying the window."""
+        self._fh.close()
+        self.destroy()
+
     def _on_save(self):
         """Handles the save button clicks"""
 
-        datestring = datetime.today().strftime("%Y-%m-%d")
-        filename = f"abq_data_record_{datestring}.csv"
-        # if filename does not exist, newfile gets True
-        newfile = not Path(filename).exists()
-
         try:
             data = self.recordform.get()
         except ValueError as e:
             self.status.set(e)
             return
-        
-        with open(filename, 'a', newline='') as fh:
-            csvwriter = csv.DictWriter(fh, fieldnames=data.keys())
-            if newfile:
-                csvwriter.writeheader()
-            csvwriter.writerow(data)
+
+        # a new day means a new file: reopen before writing
+        if datetime.today().toordinal() != self._cached_day:
+            self._fh.close()
+            self._open_csv()
+
+        if not self._header_written:
+            self._csv.writerow(self._fieldnames)
+            self._header_written = True
+        self._csv.writerow([data[key] for key in self._fieldnames])
+        self._fh.flush()
 
         self._records_saved += 1
         self.status.set(f"{self._records_saved} records saved this session.")